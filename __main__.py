@@ -1,7 +1,14 @@
 import unittest
 import tests.test_poly as test_poly
+import tests.test_multipoly as test_multipoly
+import tests.test_index as test_index
+import tests.test_stream as test_stream
 
 
 if __name__ == '__main__':
-    suite = unittest.TestLoader().loadTestsFromModule(test_poly)
+    loader = unittest.TestLoader()
+    suite = unittest.TestSuite([loader.loadTestsFromModule(test_poly),
+                                loader.loadTestsFromModule(test_multipoly),
+                                loader.loadTestsFromModule(test_index),
+                                loader.loadTestsFromModule(test_stream)])
     unittest.TextTestRunner(verbosity=2).run(suite)
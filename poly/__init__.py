@@ -1 +1,4 @@
 from poly.module import *
+from poly.multipoly import *
+from poly.index import *
+from poly.stream import *
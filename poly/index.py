@@ -0,0 +1,152 @@
+import numpy as np
+from fractions import Fraction
+from typing import Union
+from numbers import Number
+from poly.module import Poly
+
+
+class PolyIndex:
+    def __init__(self, tol: Union[Number, None] = None):
+        """
+        Initializes the content-addressed index of polynomials.
+
+        :param tol:  width of the buckets the coefficients are snapped to, exact matching if None
+        """
+
+        if not(tol is None or isinstance(tol, Number)):
+            raise TypeError("The tolerance must be of the Number type.")
+
+        if (tol is not None) and (np.isnan(tol) or np.isinf(tol) or tol <= 0):
+            raise ValueError("The tolerance must be a positive finite number.")
+
+        self._tol = None if tol is None else float(tol)
+        self._ids = {}
+        self._polys = []
+
+    @property
+    def tol(self):
+        """
+        Gets the tolerance.
+
+        :return:  width of the coefficient buckets, None for exact matching
+        """
+
+        return self._tol
+
+    def key(self, poly: Poly):
+        """
+        Computes the content key the polynomial is indexed by.
+
+        In the exact mode the polynomial itself is the key. In the tolerance-bucketed mode every
+        coefficient is rounded to the nearest multiple of the tolerance and the terms rounded to zero
+        are dropped, so polynomials with the same symbol, whose remaining terms fall into the same
+        buckets, share the key. The zero polynomial is keyed by the symbol and an empty set.
+
+        :param poly:  polynomial
+        :return:      content key
+        """
+
+        if not isinstance(poly, Poly):
+            raise TypeError("The indexed entity must be of the Poly type.")
+
+        if self._tol is None:
+            return poly
+
+        buckets = ((idx, self._bucket(c)) for idx, c in poly.coef.items())
+        return poly.symbol, frozenset((idx, bucket) for idx, bucket in buckets if bucket != 0)
+
+    def _bucket(self, c: float):
+        """
+        Computes the bucket of the coefficient.
+
+        :param c:  coefficient
+        :return:   coefficient rounded to the nearest multiple of the tolerance, in units of the tolerance
+        """
+
+        ratio = c / self._tol
+        if np.isinf(ratio):
+            # The ratio overflows the float range for tiny tolerances, hence it is computed exactly
+            return round(Fraction(c) / Fraction(self._tol))
+
+        return round(ratio)
+
+    def add(self, poly: Poly):
+        """
+        Adds the polynomial to the index unless a polynomial with the same content is already stored.
+
+        :param poly:  polynomial
+        :return:      id of the stored polynomial with the same content
+        """
+
+        key = self.key(poly)
+        poly_id = self._ids.get(key)
+        if poly_id is None:
+            poly_id = len(self._polys)
+            self._ids[key] = poly_id
+            self._polys.append(poly)
+
+        return poly_id
+
+    def update(self, polys):
+        """
+        Adds every polynomial of the iterable to the index.
+
+        :param polys:  iterable of polynomials
+        :return:       list of ids of the stored polynomials, one per input polynomial
+        """
+
+        return [self.add(poly) for poly in polys]
+
+    def find(self, poly: Poly):
+        """
+        Looks up the polynomial by content.
+
+        :param poly:  polynomial
+        :return:      id of the stored polynomial with the same content, None if there is none
+        """
+
+        return self._ids.get(self.key(poly))
+
+    def __getitem__(self, poly_id: int):
+        """
+        Gets the stored polynomial by its id.
+
+        :param poly_id:  id of the polynomial
+        :return:         first added polynomial with the given content
+        """
+
+        if not isinstance(poly_id, int):
+            raise TypeError("The id must be of the int type.")
+
+        if not(0 <= poly_id < len(self._polys)):
+            raise IndexError("The id is out of range.")
+
+        return self._polys[poly_id]
+
+    def __contains__(self, poly):
+        """
+        Returns True if a polynomial with the same content is stored.
+
+        :param poly:  polynomial
+        :return:      boolean membership result
+        """
+
+        return self.find(poly) is not None
+
+    def __len__(self):
+        """
+        Computes the length of the index.
+
+        :return:  number of stored distinct polynomials
+        """
+
+        return len(self._polys)
+
+    def __iter__(self):
+        """
+        Iterates over the stored distinct polynomials in the order of their ids.
+
+        :return:  iterator over the polynomials
+        """
+
+        return iter(self._polys)
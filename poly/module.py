@@ -1,10 +1,14 @@
 import numpy as np
+from collections.abc import Mapping
+from types import MappingProxyType
 from typing import Union
 from numbers import Number
 
 
 class Poly:
-    def __init__(self, coef: Union[Number, list, tuple, dict, np.ndarray], symbol: str = 'x'):
+    __slots__ = ('_coef', '_symbol', '_hash')
+
+    def __init__(self, coef: Union[Number, list, tuple, Mapping, np.ndarray], symbol: str = 'x'):
         """
         Initializes the polynomial.
 
@@ -12,16 +16,16 @@ class Poly:
         :param symbol:  symbol denoting the polynomial indeterminate
         """
 
-        if not(isinstance(coef, (Number, list, tuple, dict, np.ndarray)) and isinstance(symbol, str)):
+        if not(isinstance(coef, (Number, list, tuple, Mapping, np.ndarray)) and isinstance(symbol, str)):
             raise TypeError("The input must be of the appropriate type.")
 
         if isinstance(coef, Number):
             if np.isnan(coef) or np.isinf(coef):
                 raise ValueError("Coefficients must be well-defined.")
 
-            self._coef = {0: float(coef)}
+            res_coef = {0: float(coef)}
 
-        elif isinstance(coef, dict):
+        elif isinstance(coef, Mapping):
             if len(coef) == 0:
                 raise ValueError("Coefficients are not provided.")
 
@@ -37,7 +41,7 @@ class Poly:
             if any(map(lambda x: np.isnan(x) or np.isinf(x), coef.values())):
                 raise ValueError("Coefficients must be well-defined.")
 
-            self._coef = {idx: float(c) for idx, c in coef.items() if c != 0.0}
+            res_coef = {idx: float(c) for idx, c in coef.items() if c != 0.0}
 
         else:
             if len(coef) == 0:
@@ -49,12 +53,38 @@ class Poly:
             if any(map(lambda x: np.isnan(x) or np.isinf(x), coef)):
                 raise ValueError("Coefficients must be well-defined.")
 
-            self._coef = {idx: float(c) for idx, c in enumerate(coef) if c != 0.0}
+            res_coef = {idx: float(c) for idx, c in enumerate(coef) if c != 0.0}
+
+        if len(res_coef) == 0:
+            res_coef = {0: 0.0}
+
+        # The polynomial is immutable, hence the attributes are set bypassing __setattr__
+        object.__setattr__(self, '_coef', res_coef)
+        object.__setattr__(self, '_symbol', symbol)
+        object.__setattr__(self, '_hash', None)
+
+    def __setattr__(self, name, value):
+        """
+        Forbids changing the polynomial after its initialization.
+        """
+
+        raise AttributeError("Poly objects are immutable.")
+
+    def __delattr__(self, name):
+        """
+        Forbids deleting the polynomial attributes.
+        """
+
+        raise AttributeError("Poly objects are immutable.")
 
-        if len(self._coef) == 0:
-            self._coef = {0: 0.0}
+    def __reduce__(self):
+        """
+        Rebuilds the polynomial through the constructor when unpickling, as its attributes cannot be set.
 
-        self._symbol = symbol
+        :return:  constructor and its arguments
+        """
+
+        return Poly, (dict(self._coef), self._symbol)
 
     @property
     def symbol(self):
@@ -71,10 +101,10 @@ class Poly:
         """
         Gets the coefficients.
 
-        :return:  constants in front of the indeterminate extents
+        :return:  read-only view of the constants in front of the indeterminate extents
         """
 
-        return self._coef
+        return MappingProxyType(self._coef)
 
     @property
     def degree(self):
@@ -184,6 +214,9 @@ class Poly:
         """
 
         if not isinstance(other, Poly):
+            # Operands of other types, such as MultiPoly, are left to their reflected operators
+            if not isinstance(other, (Number, list, tuple, Mapping, np.ndarray)):
+                return NotImplemented
             other = Poly(other, symbol=self.symbol)
         elif self._symbol != other.symbol:
             raise ValueError("Polynomial symbols differ.")
@@ -203,6 +236,9 @@ class Poly:
         """
 
         if not isinstance(other, Poly):
+            # Operands of other types, such as MultiPoly, are left to their reflected operators
+            if not isinstance(other, (Number, list, tuple, Mapping, np.ndarray)):
+                return NotImplemented
             other = Poly(other, symbol=self.symbol)
         elif self._symbol != other.symbol:
             raise ValueError("Polynomial symbols differ.")
@@ -232,6 +268,9 @@ class Poly:
         """
 
         if not isinstance(other, Poly):
+            # Operands of other types, such as MultiPoly, are left to their reflected operators
+            if not isinstance(other, (Number, list, tuple, Mapping, np.ndarray)):
+                return NotImplemented
             other = Poly(other, symbol=self.symbol)
         elif self._symbol != other.symbol:
             raise ValueError("Polynomial symbols differ.")
@@ -296,11 +335,12 @@ class Poly:
         Returns True if two polynomials are equal.
 
         :param other:  compared polynomial
-        :return:       boolean comparison result
+        :return:       boolean comparison result, NotImplemented for a non-Poly comparand
         """
 
+        # Other types are left to Python, so that a Poly may share dicts and sets with other keys
         if not isinstance(other, Poly):
-            raise TypeError("The compared entity must of the Poly type.")
+            return NotImplemented
 
         if self._symbol != other.symbol:
             return False
@@ -309,16 +349,29 @@ class Poly:
         else:
             return True
 
+    def __hash__(self):
+        """
+        Computes the content hash of the polynomial, caching it on the first call.
+
+        :return:  hash over the symbol and the coefficients
+        """
+
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hash((self._symbol, frozenset(self._coef.items()))))
+
+        return self._hash
+
     def __ne__(self, other):
         """
         Returns True if two polynomials are different.
 
         :param other:  compared polynomial
-        :return:       boolean comparison result
+        :return:       boolean comparison result, NotImplemented for a non-Poly comparand
         """
 
+        # Other types are left to Python, so that a Poly may share dicts and sets with other keys
         if not isinstance(other, Poly):
-            raise TypeError("The compared entity must of the Poly type.")
+            return NotImplemented
 
         if self._symbol != other.symbol:
             return True
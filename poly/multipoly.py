@@ -0,0 +1,449 @@
+import heapq
+import numpy as np
+from typing import Union
+from numbers import Number
+from poly.module import Poly
+
+
+class MultiPoly:
+    # Every exponent occupies a fixed-width field of the packed monomial integer. The top bit of
+    # each field is kept clear as a guard, so the sum of two valid exponents never carries into
+    # the neighbouring field and an overflow can be detected with a single mask test.
+    _FIELD_BITS = 16
+    _MAX_EXPONENT = (1 << (_FIELD_BITS - 1)) - 1
+
+    def __init__(self, coef: Union[Number, dict], symbols: Union[list, tuple] = ('x', 'y')):
+        """
+        Initializes the multivariate polynomial.
+
+        :param coef:     constants in front of the monomials, keyed by tuples of exponents
+        :param symbols:  symbols denoting the polynomial indeterminates
+        """
+
+        if not(isinstance(coef, (Number, dict)) and isinstance(symbols, (list, tuple))):
+            raise TypeError("The input must be of the appropriate type.")
+
+        if len(symbols) == 0:
+            raise ValueError("Symbols are not provided.")
+
+        if any(map(lambda x: not(isinstance(x, str)), symbols)):
+            raise TypeError("Symbols must be the str type.")
+
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("Symbols must be unique.")
+
+        self._symbols = tuple(symbols)
+
+        if isinstance(coef, Number):
+            if np.isnan(coef) or np.isinf(coef):
+                raise ValueError("Coefficients must be well-defined.")
+
+            self._coef = {0: float(coef)}
+
+        else:
+            if len(coef) == 0:
+                raise ValueError("Coefficients are not provided.")
+
+            if any(map(lambda x: not(isinstance(x, tuple)) or len(x) != len(self._symbols), coef.keys())):
+                raise TypeError("Exponents must be tuples matching the number of symbols.")
+
+            if any(map(lambda x: any(map(lambda e: not(isinstance(e, int)), x)), coef.keys())):
+                raise TypeError("Exponents must be the int type.")
+
+            if any(map(lambda x: any(map(lambda e: e < 0, x)), coef.keys())):
+                raise ValueError("Exponents must be greater than or equal to zero.")
+
+            if any(map(lambda x: any(map(lambda e: e > self._MAX_EXPONENT, x)), coef.keys())):
+                raise ValueError(f"Exponents must not exceed {self._MAX_EXPONENT}.")
+
+            if any(map(lambda x: not(isinstance(x, Number)), coef.values())):
+                raise TypeError("Coefficients must be of the Number type.")
+
+            if any(map(lambda x: np.isnan(x) or np.isinf(x), coef.values())):
+                raise ValueError("Coefficients must be well-defined.")
+
+            self._coef = {}
+            for exponents, c in coef.items():
+                if c != 0.0:
+                    key = self._pack(exponents)
+                    self._coef[key] = self._coef.get(key, 0.0) + float(c)
+            self._coef = {key: c for key, c in self._coef.items() if c != 0.0}
+
+        if len(self._coef) == 0:
+            self._coef = {0: 0.0}
+
+    @classmethod
+    def _from_packed(cls, packed_coef: dict, symbols: tuple):
+        """
+        Builds the polynomial directly from packed monomials, bypassing the input validation.
+
+        :param packed_coef:  constants in front of the monomials, keyed by packed exponents
+        :param symbols:      symbols denoting the polynomial indeterminates
+        :return:             multivariate polynomial
+        """
+
+        res = cls.__new__(cls)
+        res._symbols = symbols
+        res._coef = {key: c for key, c in packed_coef.items() if c != 0.0}
+        if len(res._coef) == 0:
+            res._coef = {0: 0.0}
+
+        return res
+
+    @classmethod
+    def _pack(cls, exponents: tuple):
+        """
+        Packs a tuple of exponents into a single integer, the first exponent being the most significant.
+
+        :param exponents:  exponents of the monomial
+        :return:           packed monomial
+        """
+
+        key = 0
+        for e in exponents:
+            key = (key << cls._FIELD_BITS) | e
+
+        return key
+
+    def _unpack(self, key: int):
+        """
+        Unpacks a single integer into a tuple of exponents.
+
+        :param key:  packed monomial
+        :return:     exponents of the monomial
+        """
+
+        mask = (1 << self._FIELD_BITS) - 1
+        exponents = []
+        for _ in range(len(self._symbols)):
+            exponents.append(key & mask)
+            key >>= self._FIELD_BITS
+
+        return tuple(reversed(exponents))
+
+    def _guard_mask(self):
+        """
+        Computes the mask of the guard bits of every exponent field.
+
+        :return:  guard bit mask
+        """
+
+        return self._pack((self._MAX_EXPONENT + 1,) * len(self._symbols))
+
+    @property
+    def symbols(self):
+        """
+        Gets the symbols.
+
+        :return:  symbols denoting the polynomial indeterminates
+        """
+
+        return self._symbols
+
+    @property
+    def coef(self):
+        """
+        Gets the coefficients.
+
+        :return:  constants in front of the monomials, keyed by tuples of exponents
+        """
+
+        return {self._unpack(key): c for key, c in self._coef.items()}
+
+    @property
+    def degree(self):
+        """
+        Returns the maximum total degree of the polynomial monomials.
+
+        :return:  degree of the polynomial
+        """
+
+        return max(map(lambda x: sum(self._unpack(x)), self._coef.keys()))
+
+    def copy(self):
+        """
+        Copies the polynomial object.
+
+        :return:  polynomial duplicate
+        """
+
+        return MultiPoly._from_packed(self._coef, self._symbols)
+
+    @classmethod
+    def from_poly(cls, poly: Poly, symbols: Union[list, tuple, None] = None):
+        """
+        Converts a univariate polynomial into the multivariate one.
+
+        :param poly:     univariate polynomial
+        :param symbols:  symbols of the result, must contain the symbol of the univariate polynomial
+        :return:         multivariate polynomial
+        """
+
+        if not isinstance(poly, Poly):
+            raise TypeError("The input must be of the Poly type.")
+
+        if symbols is None:
+            symbols = (poly.symbol,)
+
+        if not isinstance(symbols, (list, tuple)):
+            raise TypeError("The input must be of the appropriate type.")
+
+        if poly.symbol not in symbols:
+            raise ValueError("Polynomial symbol is missing from the symbols.")
+
+        pos = list(symbols).index(poly.symbol)
+        coef = {}
+        for idx, c in poly.coef.items():
+            exponents = [0] * len(symbols)
+            exponents[pos] = idx
+            coef[tuple(exponents)] = c
+
+        return cls(coef, symbols=symbols)
+
+    def to_poly(self):
+        """
+        Converts the polynomial into the univariate one, provided at most one indeterminate is used.
+
+        :return:  univariate polynomial
+        """
+
+        used = set()
+        for key in self._coef.keys():
+            used.update(pos for pos, e in enumerate(self._unpack(key)) if e != 0)
+
+        if len(used) > 1:
+            raise ValueError("The polynomial depends on more than one indeterminate.")
+
+        pos = used.pop() if len(used) == 1 else 0
+        res_coef = {self._unpack(key)[pos]: c for key, c in self._coef.items()}
+
+        return Poly(res_coef, symbol=self._symbols[pos])
+
+    def _convert(self, other):
+        """
+        Brings the other operand to a multivariate polynomial over the same symbols.
+
+        :param other:  operand of a binary operation
+        :return:       multivariate polynomial
+        """
+
+        if isinstance(other, MultiPoly):
+            if self._symbols != other.symbols:
+                raise ValueError("Polynomial symbols differ.")
+            return other
+        elif isinstance(other, Poly):
+            if other.symbol not in self._symbols:
+                raise ValueError("Polynomial symbols differ.")
+            return MultiPoly.from_poly(other, symbols=self._symbols)
+        else:
+            return MultiPoly(other, symbols=self._symbols)
+
+    def __len__(self):
+        """
+        Computes the length of the polynomial.
+
+        :return:  number of monomials with non-zero coefficients
+        """
+
+        return len(self._coef)
+
+    def __str__(self):
+        """
+        Produces the human-readable string representation for the polynomial.
+
+        :return:  polynomial string representation
+        """
+
+        if (len(self._coef) == 1) and (self._coef.get(0) is not None):
+            return str(self._coef[0])
+        else:
+            poly_string = ''
+            for key, c in sorted(self._coef.items(), key=lambda x: -x[0]):
+                if (len(poly_string) != 0) and (c > 0):
+                    poly_string += '+ '
+                elif (len(poly_string) != 0) and (c < 0):
+                    poly_string += '- '
+                elif (len(poly_string) == 0) and (c < 0):
+                    poly_string += '-'
+
+                factors = []
+                for symbol, e in zip(self._symbols, self._unpack(key)):
+                    if e > 1:
+                        factors.append(f'{symbol}^{e}')
+                    elif e == 1:
+                        factors.append(symbol)
+
+                if len(factors) == 0:
+                    poly_string += str(abs(c))
+                elif np.isclose(abs(c), 1.0):
+                    poly_string += '*'.join(factors) + ' '
+                else:
+                    poly_string += f'{abs(c)}*' + '*'.join(factors) + ' '
+
+        poly_string = poly_string.strip()
+
+        return poly_string
+
+    def __add__(self, other):
+        """
+        Computes the sum of two polynomials.
+
+        :param other:  polynomial summand
+        :return:       sum of two polynomials
+        """
+
+        other = self._convert(other)
+
+        res_coef = self._coef.copy()
+        for key, c in other._coef.items():
+            res_coef[key] = res_coef.get(key, 0.0) + c
+
+        return MultiPoly._from_packed(res_coef, self._symbols)
+
+    def __sub__(self, other):
+        """
+        Computes the difference between two polynomials.
+
+        :param other:  polynomial subtrahend
+        :return:       the difference between two polynomials
+        """
+
+        other = self._convert(other)
+
+        res_coef = self._coef.copy()
+        for key, c in other._coef.items():
+            res_coef[key] = res_coef.get(key, 0.0) - c
+
+        return MultiPoly._from_packed(res_coef, self._symbols)
+
+    def __radd__(self, other):
+        """
+        Computes the sum of two polynomials with the polynomial on the right.
+
+        :param other:  polynomial summand
+        :return:       sum of two polynomials
+        """
+
+        return self + other
+
+    def __rsub__(self, other):
+        """
+        Computes the difference between two polynomials with the polynomial on the right.
+
+        :param other:  polynomial minuend
+        :return:       the difference between two polynomials
+        """
+
+        return self._convert(other) - self
+
+    def __neg__(self):
+        """
+        Computes the negation of the polynomial.
+
+        :return:  initial polynomial multiplied by (-1)
+        """
+
+        res_coef = dict(map(lambda x: (x[0], -x[1]), self._coef.items()))
+        return MultiPoly._from_packed(res_coef, self._symbols)
+
+    def __mul__(self, other):
+        """
+        Computes the product of two polynomials by merging the partial products through a heap.
+        The monomials come off the heap in descending order, so equal ones arrive consecutively
+        and are combined with the last collected term.
+
+        :param other:  polynomial multiplier
+        :return:       product of two polynomials
+        """
+
+        other = self._convert(other)
+
+        lhs = sorted(self._coef.items(), key=lambda x: -x[0])
+        rhs = sorted(other._coef.items(), key=lambda x: -x[0])
+        guard = self._guard_mask()
+
+        res_keys, res_coefs = [], []
+        heap = [(-(lhs[0][0] + rhs[0][0]), 0, 0)]
+        while len(heap) != 0:
+            neg_key, i, j = heapq.heappop(heap)
+            if (-neg_key) & guard:
+                raise ValueError(f"Exponents must not exceed {self._MAX_EXPONENT}.")
+
+            if (len(res_keys) != 0) and (res_keys[-1] == -neg_key):
+                res_coefs[-1] += lhs[i][1] * rhs[j][1]
+            else:
+                res_keys.append(-neg_key)
+                res_coefs.append(lhs[i][1] * rhs[j][1])
+
+            if (j == 0) and (i + 1 < len(lhs)):
+                heapq.heappush(heap, (-(lhs[i + 1][0] + rhs[0][0]), i + 1, 0))
+            if j + 1 < len(rhs):
+                heapq.heappush(heap, (-(lhs[i][0] + rhs[j + 1][0]), i, j + 1))
+
+        return MultiPoly._from_packed(dict(zip(res_keys, res_coefs)), self._symbols)
+
+    def __rmul__(self, other):
+        """
+        Computes the product of two polynomials with the polynomial on the right.
+
+        :param other:  polynomial multiplicand
+        :return:       product of two polynomials
+        """
+
+        return self._convert(other) * self
+
+    def __pow__(self, power, modulo=None):
+        """
+        Computes an integer power of the polynomial.
+
+        :param power:  exponent
+        :return:       polynomial raised to an integer power
+        """
+
+        if not isinstance(power, int):
+            raise TypeError("The power must be of the int type.")
+
+        res = MultiPoly(1.0, symbols=self._symbols)
+        if power < 0:
+            raise ValueError("The power must be greater than or equal to zero.")
+        elif power > 0:
+            for i in range(power):
+                res *= self
+
+        return res
+
+    def __eq__(self, other):
+        """
+        Returns True if two polynomials are equal.
+
+        :param other:  compared polynomial
+        :return:       boolean comparison result, NotImplemented for a non-MultiPoly comparand
+        """
+
+        if not isinstance(other, MultiPoly):
+            return NotImplemented
+
+        if self._symbols != other.symbols:
+            return False
+        elif self._coef != other._coef:
+            return False
+        else:
+            return True
+
+    def __ne__(self, other):
+        """
+        Returns True if two polynomials are different.
+
+        :param other:  compared polynomial
+        :return:       boolean comparison result, NotImplemented for a non-MultiPoly comparand
+        """
+
+        if not isinstance(other, MultiPoly):
+            return NotImplemented
+
+        if self._symbols != other.symbols:
+            return True
+        elif self._coef != other._coef:
+            return True
+        else:
+            return False
@@ -0,0 +1,248 @@
+import os
+import threading
+import numpy as np
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Union
+from poly.module import Poly
+
+
+def _open_source(source: Union[str, os.PathLike, np.ndarray]):
+    """
+    Opens the x-values for reading without loading them into memory.
+
+    :param source:  path to a .npy file or a raw float64 file, or an array of x-values
+    :return:        one-dimensional array of x-values, memory-mapped when read from a file
+    """
+
+    if isinstance(source, (str, os.PathLike)):
+        if os.fspath(source).endswith('.npy'):
+            source = np.load(source, mmap_mode='r')
+        elif os.path.getsize(source) == 0:
+            # An empty file cannot be memory-mapped
+            source = np.empty(0, dtype=np.float64)
+        else:
+            source = np.memmap(source, dtype=np.float64, mode='r')
+    elif not isinstance(source, np.ndarray):
+        raise TypeError("The source must be a path or of the np.ndarray type.")
+
+    if source.dtype.kind not in 'iuf':
+        raise TypeError("The source must be of a real integer or floating dtype.")
+
+    if source.ndim != 1:
+        raise ValueError("The source must be one-dimensional.")
+
+    return source
+
+
+def _prepare(polys: Union[Poly, list, tuple]):
+    """
+    Extracts the exponents and the coefficients of the polynomials in descending order of exponents.
+
+    :param polys:  polynomial or sequence of polynomials
+    :return:       list of (exponents, coefficients) array pairs, one per polynomial
+    """
+
+    if isinstance(polys, Poly):
+        polys = (polys,)
+    elif not isinstance(polys, (list, tuple)):
+        raise TypeError("The input must be of the Poly type or a sequence of Poly.")
+
+    if len(polys) == 0:
+        raise ValueError("Polynomials are not provided.")
+
+    if any(map(lambda x: not(isinstance(x, Poly)), polys)):
+        raise TypeError("The input must be of the Poly type or a sequence of Poly.")
+
+    kernels = []
+    for poly in polys:
+        exps = np.fromiter(poly.coef.keys(), dtype=np.int64, count=len(poly))
+        coefs = np.fromiter(poly.coef.values(), dtype=np.float64, count=len(poly))
+        order = np.argsort(-exps)
+        kernels.append((exps[order], coefs[order]))
+
+    return kernels
+
+
+def _check_chunking(chunk_size: int, workers: Union[int, None]):
+    """
+    Validates the chunking parameters.
+
+    :param chunk_size:  number of x-values evaluated at once
+    :param workers:     number of threads, None for the evaluation in the calling thread
+    """
+
+    if not isinstance(chunk_size, int) or isinstance(chunk_size, bool):
+        raise TypeError("The chunk size and the number of workers must be of the int type.")
+
+    if not(workers is None or isinstance(workers, int)) or isinstance(workers, bool):
+        raise TypeError("The chunk size and the number of workers must be of the int type.")
+
+    if chunk_size <= 0:
+        raise ValueError("The chunk size must be greater than zero.")
+
+    if (workers is not None) and (workers <= 0):
+        raise ValueError("The number of workers must be greater than zero.")
+
+
+def _thread_buffers(local: threading.local, size: int):
+    """
+    Gets the scratch buffers of the calling thread, allocating them on the first call.
+
+    :param local:  thread-local storage shared by the threads of one evaluation
+    :param size:   number of x-values in the largest chunk
+    :return:       pair of float64 buffers for the x-values and the powers of them
+    """
+
+    if not hasattr(local, 'buffers'):
+        local.buffers = np.empty(size, dtype=np.float64), np.empty(size, dtype=np.float64)
+
+    return local.buffers
+
+
+def _evaluate_chunk(kernels: list, source: np.ndarray, start: int, stop: int, out: np.ndarray, buffers: tuple):
+    """
+    Evaluates the polynomials on a chunk of x-values by the sparse Horner scheme, in place.
+
+    :param kernels:  exponents and coefficients of the polynomials in descending order of exponents
+    :param source:   array of x-values
+    :param start:    first index of the chunk
+    :param stop:     index past the last one of the chunk
+    :param out:      array of shape (number of polynomials, stop - start) the values are written to
+    :param buffers:  pair of float64 scratch buffers of at least stop - start elements
+    """
+
+    x, tmp = buffers[0][:stop - start], buffers[1][:stop - start]
+    np.copyto(x, source[start:stop])
+    for (exps, coefs), res in zip(kernels, out):
+        res.fill(coefs[0])
+        for k in range(1, len(exps) + 1):
+            gap = exps[k - 1] - exps[k] if k < len(exps) else exps[k - 1]
+            if gap == 1:
+                np.multiply(res, x, out=res)
+            elif gap > 1:
+                np.power(x, gap, out=tmp)
+                np.multiply(res, tmp, out=res)
+
+            if k < len(exps):
+                res += coefs[k]
+
+
+def evaluate_chunks(polys: Union[Poly, list, tuple], source: Union[str, os.PathLike, np.ndarray],
+                    chunk_size: int = 1 << 20, workers: Union[int, None] = None):
+    """
+    Evaluates the polynomials on the x-values chunk by chunk, keeping at most one chunk per worker in memory.
+
+    The x-values are read into scratch buffers allocated once per thread, while every yielded chunk of
+    values is a new array, so that it stays valid after the next chunk is produced.
+
+    :param polys:       polynomial or sequence of polynomials
+    :param source:      path to a .npy file or a raw float64 file, or an array of x-values
+    :param chunk_size:  number of x-values evaluated at once
+    :param workers:     number of threads reading and evaluating chunks ahead, None for the calling thread
+    :return:            generator of the values, in order, of shape (chunk,) for a single polynomial
+                        and of shape (number of polynomials, chunk) for a sequence
+    """
+
+    single = isinstance(polys, Poly)
+    kernels = _prepare(polys)
+    source = _open_source(source)
+    _check_chunking(chunk_size, workers)
+
+    local = threading.local()
+
+    def job(start):
+        stop = min(start + chunk_size, len(source))
+        values = np.empty((len(kernels), stop - start), dtype=np.float64)
+        _evaluate_chunk(kernels, source, start, stop, values, _thread_buffers(local, min(chunk_size, len(source))))
+        return values[0] if single else values
+
+    def generate():
+        starts = range(0, len(source), chunk_size)
+        if workers is None:
+            for start in starts:
+                yield job(start)
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for start in starts:
+                    if len(pending) == workers:
+                        yield pending.popleft().result()
+                    pending.append(executor.submit(job, start))
+                while len(pending) != 0:
+                    yield pending.popleft().result()
+
+    # The generator is wrapped so that the input is validated on the call rather than on the first chunk
+    return generate()
+
+
+def evaluate_to(polys: Union[Poly, list, tuple], source: Union[str, os.PathLike, np.ndarray],
+                out: Union[str, os.PathLike, np.ndarray], chunk_size: int = 1 << 20,
+                workers: Union[int, None] = None):
+    """
+    Evaluates the polynomials on the x-values chunk by chunk, writing the values straight into the output.
+
+    The x-values are read into scratch buffers allocated once per thread and reused for every chunk.
+
+    :param polys:       polynomial or sequence of polynomials
+    :param source:      path to a .npy file or a raw float64 file, or an array of x-values
+    :param out:         path to a .npy file or a raw float64 file to be created, or an array to write to,
+                        of shape (number of x-values,) for a single polynomial and of shape
+                        (number of polynomials, number of x-values) for a sequence
+    :param chunk_size:  number of x-values evaluated at once
+    :param workers:     number of threads evaluating chunks concurrently, at most that many chunks
+                        being in flight, None for the calling thread
+    :return:            output array, memory-mapped when written to a file
+    """
+
+    single = isinstance(polys, Poly)
+    kernels = _prepare(polys)
+    source = _open_source(source)
+    _check_chunking(chunk_size, workers)
+
+    shape = (len(source),) if single else (len(kernels), len(source))
+    if isinstance(out, (str, os.PathLike)):
+        if os.fspath(out).endswith('.npy'):
+            out = np.lib.format.open_memmap(out, mode='w+', dtype=np.float64, shape=shape)
+        elif len(source) == 0:
+            # An empty file cannot be memory-mapped
+            open(out, 'wb').close()
+            out = np.empty(shape, dtype=np.float64)
+        else:
+            out = np.memmap(out, dtype=np.float64, mode='w+', shape=shape)
+    elif not isinstance(out, np.ndarray):
+        raise TypeError("The output must be a path or of the np.ndarray type.")
+
+    if out.shape != shape:
+        raise ValueError(f"The output must be of shape {shape}.")
+
+    if out.dtype != np.float64:
+        raise ValueError("The output must be of the float64 dtype.")
+
+    values = out[np.newaxis] if single else out
+
+    local = threading.local()
+
+    def job(start):
+        stop = min(start + chunk_size, len(source))
+        _evaluate_chunk(kernels, source, start, stop, values[:, start:stop],
+                        _thread_buffers(local, min(chunk_size, len(source))))
+
+    starts = range(0, len(source), chunk_size)
+    if workers is None:
+        for start in starts:
+            job(start)
+    else:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for start in starts:
+                if len(pending) == workers:
+                    pending.popleft().result()
+                pending.append(executor.submit(job, start))
+            while len(pending) != 0:
+                pending.popleft().result()
+
+    if isinstance(out, np.memmap):
+        out.flush()
+
+    return out
@@ -0,0 +1,90 @@
+import unittest
+import numpy as np
+from poly import Poly, PolyIndex
+
+
+class TestPolyIndex(unittest.TestCase):
+
+    def test_init(self):
+        # Wrong tolerance type
+        self.assertRaises(TypeError, PolyIndex, tol='abc')
+
+        # Wrong tolerance value
+        self.assertRaises(ValueError, PolyIndex, tol=0)
+        self.assertRaises(ValueError, PolyIndex, tol=-1e-6)
+        self.assertRaises(ValueError, PolyIndex, tol=np.nan)
+        self.assertRaises(ValueError, PolyIndex, tol=np.inf)
+
+        self.assertIsNone(PolyIndex().tol)
+        self.assertEqual(PolyIndex(tol=1e-6).tol, 1e-6)
+
+    def test_key(self):
+        # Wrong input type
+        self.assertRaises(TypeError, PolyIndex().key, [1, 2])
+
+        self.assertEqual(PolyIndex().key(Poly([1, 2])), Poly([1, 2]))
+        self.assertEqual(PolyIndex(tol=0.1).key(Poly([1, 2.02])), PolyIndex(tol=0.1).key(Poly([0.98, 2])))
+        self.assertNotEqual(PolyIndex(tol=0.1).key(Poly([1, 2])), PolyIndex(tol=0.1).key(Poly([1, 2], symbol='y')))
+
+    def test_add(self):
+        index = PolyIndex()
+
+        self.assertEqual(index.add(Poly([1, 2])), 0)
+        self.assertEqual(index.add(Poly([3])), 1)
+        self.assertEqual(index.add(Poly({0: 1, 1: 2})), 0)
+        self.assertEqual(index.add(Poly([1, 2], symbol='y')), 2)
+        self.assertEqual(len(index), 3)
+
+        # Near-equal coefficients are distinct in the exact mode
+        self.assertEqual(index.add(Poly([1, 2 + 1e-12])), 3)
+
+    def test_update(self):
+        index = PolyIndex()
+
+        self.assertEqual(index.update([Poly([1, 2]), Poly(0), Poly((1, 2)), Poly([0, 0])]), [0, 1, 0, 1])
+        self.assertEqual(list(index), [Poly([1, 2]), Poly(0)])
+
+    def test_tol(self):
+        index = PolyIndex(tol=1e-6)
+
+        self.assertEqual(index.update([Poly([1, 2]), Poly([1 + 1e-9, 2 - 1e-9]), Poly([1, 2.1])]), [0, 0, 1])
+        self.assertEqual(index[0].coef, {0: 1.0, 1: 2.0})
+
+        # Exponents must match
+        self.assertEqual(index.add(Poly({0: 1, 2: 2})), 2)
+
+        # Terms rounded to zero are dropped
+        self.assertEqual(index.update([Poly([1, 2, 1e-12]), Poly([1e-12, 1e-9]), Poly(0)]), [0, 3, 3])
+
+        # Buckets beyond the float range
+        index = PolyIndex(tol=1e-300)
+        self.assertEqual(index.update([Poly([1e300]), Poly([1e300]), Poly([-1e300])]), [0, 0, 1])
+
+    def test_find(self):
+        index = PolyIndex()
+        index.update([Poly([1, 2]), Poly([3])])
+
+        self.assertEqual(index.find(Poly((1, 2))), 0)
+        self.assertEqual(index.find(Poly(3)), 1)
+        self.assertIsNone(index.find(Poly([1, 2], symbol='y')))
+
+    def test_getitem(self):
+        index = PolyIndex()
+        index.add(Poly([1, 2]))
+
+        self.assertRaises(TypeError, index.__getitem__, 'a')
+        self.assertRaises(IndexError, index.__getitem__, 1)
+        self.assertRaises(IndexError, index.__getitem__, -1)
+
+        self.assertEqual(index[0], Poly([1, 2]))
+
+    def test_contains(self):
+        index = PolyIndex()
+        index.add(Poly([1, 2]))
+
+        self.assertIn(Poly({1: 2, 0: 1}), index)
+        self.assertNotIn(Poly([2, 1]), index)
+
+
+if __name__ == '__main__':
+    unittest.main()
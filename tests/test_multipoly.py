@@ -0,0 +1,219 @@
+import unittest
+import numpy as np
+from poly import Poly, MultiPoly
+
+
+class TestMultiPoly(unittest.TestCase):
+
+    def test_init(self):
+        # Wrong input types
+        self.assertRaises(TypeError, MultiPoly, coef='abc')
+        self.assertRaises(TypeError, MultiPoly, coef=[0, 1, 2])
+        self.assertRaises(TypeError, MultiPoly, coef={(0, 0): 1}, symbols='xy')
+        self.assertRaises(TypeError, MultiPoly, coef={(0, 0): 1}, symbols=('x', 0))
+
+        # Empty and duplicate symbols
+        self.assertRaises(ValueError, MultiPoly, coef=1, symbols=())
+        self.assertRaises(ValueError, MultiPoly, coef=1, symbols=('x', 'x'))
+
+        # NaN and Inf values as a Number input
+        self.assertRaises(ValueError, MultiPoly, coef=np.nan)
+        self.assertRaises(ValueError, MultiPoly, coef=np.inf)
+
+        # Empty dict as an input
+        self.assertRaises(ValueError, MultiPoly, coef={})
+
+        # Wrong key and value types in the input dict
+        self.assertRaises(TypeError, MultiPoly, coef={1: 1})
+        self.assertRaises(TypeError, MultiPoly, coef={(1, 2, 3): 1})
+        self.assertRaises(TypeError, MultiPoly, coef={(1, 'a'): 1})
+        self.assertRaises(TypeError, MultiPoly, coef={(1, 2): 'a'})
+
+        # Wrong key value in the input dict
+        self.assertRaises(ValueError, MultiPoly, coef={(-1, 2): 1})
+        self.assertRaises(ValueError, MultiPoly, coef={(1, 2 ** 15): 1})
+
+        # NaN and Inf values in the input dict
+        self.assertRaises(ValueError, MultiPoly, coef={(1, 0): np.nan})
+        self.assertRaises(ValueError, MultiPoly, coef={(1, 0): np.inf})
+
+    def test_symbols(self):
+        # Default symbols
+        self.assertEqual(MultiPoly(1).symbols, ('x', 'y'))
+
+        # Arbitrary symbols
+        self.assertEqual(MultiPoly(1, symbols=['u', 'v', 'w']).symbols, ('u', 'v', 'w'))
+
+    def test_coef(self):
+        # Number input
+        self.assertEqual(MultiPoly(0).coef, {(0, 0): 0.0})
+        self.assertEqual(MultiPoly(1).coef, {(0, 0): 1.0})
+
+        # Dict input
+        self.assertEqual(MultiPoly({(0, 0): 0, (1, 2): 0}).coef, {(0, 0): 0.0})
+        self.assertEqual(MultiPoly({(0, 0): 1, (1, 2): 0}).coef, {(0, 0): 1.0})
+        self.assertEqual(MultiPoly({(0, 1, 2): 3, (4, 0, 0): 5}, symbols=('x', 'y', 'z')).coef,
+                         {(0, 1, 2): 3.0, (4, 0, 0): 5.0})
+
+    def test_degree(self):
+        self.assertEqual(MultiPoly(5).degree, 0)
+        self.assertEqual(MultiPoly({(0, 0): 0, (3, 2): 0}).degree, 0)
+        self.assertEqual(MultiPoly({(4, 0): 1, (2, 3): 1}).degree, 5)
+
+    def test_copy(self):
+        poly = MultiPoly({(1, 0): 1, (0, 2): 2})
+        poly_copy = poly.copy()
+
+        self.assertIsInstance(poly_copy, MultiPoly)
+        self.assertEqual(poly_copy, poly)
+        self.assertIsNot(poly_copy, poly)
+
+    def test_from_poly(self):
+        # Wrong input types
+        self.assertRaises(TypeError, MultiPoly.from_poly, 5)
+        self.assertRaises(TypeError, MultiPoly.from_poly, Poly([1, 2]), symbols='xy')
+
+        # Missing symbol
+        self.assertRaises(ValueError, MultiPoly.from_poly, Poly([1, 2], symbol='z'), symbols=('x', 'y'))
+
+        self.assertEqual(MultiPoly.from_poly(Poly([1, 2])), MultiPoly({(0,): 1, (1,): 2}, symbols=('x',)))
+        self.assertEqual(MultiPoly.from_poly(Poly([1, 0, 3], symbol='y'), symbols=('x', 'y')),
+                         MultiPoly({(0, 0): 1, (0, 2): 3}))
+
+    def test_to_poly(self):
+        # More than one indeterminate is used
+        self.assertRaises(ValueError, MultiPoly({(1, 1): 1}).to_poly)
+
+        self.assertEqual(MultiPoly(5).to_poly(), Poly(5))
+        self.assertEqual(MultiPoly({(0, 0): 1, (0, 2): 3}).to_poly(), Poly([1, 0, 3], symbol='y'))
+
+        # Round trip
+        poly = Poly({0: -1, 4: 2.5}, symbol='z')
+        self.assertEqual(MultiPoly.from_poly(poly, symbols=('x', 'y', 'z')).to_poly(), poly)
+
+    def test_len(self):
+        self.assertEqual(len(MultiPoly(5)), 1)
+        self.assertEqual(len(MultiPoly({(0, 0): 0, (1, 1): 0})), 1)
+        self.assertEqual(len(MultiPoly({(0, 0): 1, (1, 1): 0, (2, 0): 1})), 2)
+
+    def test_str(self):
+        # Monomial representation
+        self.assertEqual(str(MultiPoly(5)), '5.0')
+        self.assertEqual(str(MultiPoly({(0, 0): 0, (1, 1): 0})), '0.0')
+        self.assertEqual(str(MultiPoly({(2, 1): -5})), '-5.0*x^2*y')
+        self.assertEqual(str(MultiPoly({(0, 3): 1})), 'y^3')
+
+        # Polynomial representation
+        self.assertEqual(str(MultiPoly({(0, 0): 1, (1, 0): 2, (0, 1): -1, (1, 1): 1})), 'x*y + 2.0*x - y + 1.0')
+        self.assertEqual(str(MultiPoly({(0, 0, 0): -1, (0, 2, 1): 3}, symbols=('u', 'v', 'w'))),
+                         '3.0*v^2*w - 1.0')
+
+    def test_add(self):
+        # Different symbols for the indeterminates
+        with self.assertRaises(ValueError):
+            poly = MultiPoly(1, symbols=('x', 'y')) + MultiPoly(1, symbols=('x', 'z'))
+        with self.assertRaises(ValueError):
+            poly = MultiPoly(1) + Poly([0, 1], symbol='z')
+
+        # Number input
+        self.assertEqual(MultiPoly({(1, 1): 2}) + 3, MultiPoly({(1, 1): 2, (0, 0): 3}))
+
+        # Poly input
+        self.assertEqual(MultiPoly({(1, 0): 1}) + Poly([0, 1], symbol='y'), MultiPoly({(1, 0): 1, (0, 1): 1}))
+
+        # Reflected Number and Poly input
+        self.assertEqual(3 + MultiPoly({(1, 1): 2}), MultiPoly({(1, 1): 2, (0, 0): 3}))
+        self.assertEqual(Poly([0, 1], symbol='y') + MultiPoly({(1, 0): 1}), MultiPoly({(1, 0): 1, (0, 1): 1}))
+        with self.assertRaises(ValueError):
+            poly = Poly([0, 1], symbol='z') + MultiPoly(1)
+
+        # MultiPoly input
+        self.assertEqual(MultiPoly({(1, 0): 1, (0, 1): 2}) + MultiPoly({(1, 0): -1, (0, 0): 4}),
+                         MultiPoly({(0, 1): 2, (0, 0): 4}))
+
+    def test_sub(self):
+        # Different symbols for the indeterminates
+        with self.assertRaises(ValueError):
+            poly = MultiPoly(1, symbols=('x', 'y')) - MultiPoly(1, symbols=('y', 'x'))
+
+        self.assertEqual(MultiPoly({(1, 1): 2}) - 3, MultiPoly({(1, 1): 2, (0, 0): -3}))
+        self.assertEqual(MultiPoly({(1, 0): 1, (0, 1): 2}) - MultiPoly({(1, 0): 1, (0, 1): 2}), MultiPoly(0))
+
+        # Poly input in both operand orders
+        self.assertEqual(MultiPoly({(1, 0): 1}) - Poly([0, 1], symbol='y'), MultiPoly({(1, 0): 1, (0, 1): -1}))
+        self.assertEqual(Poly([0, 1], symbol='y') - MultiPoly({(1, 0): 1}), MultiPoly({(1, 0): -1, (0, 1): 1}))
+
+        # Reflected Number input
+        self.assertEqual(3 - MultiPoly({(1, 1): 2}), MultiPoly({(1, 1): -2, (0, 0): 3}))
+
+    def test_neg(self):
+        self.assertEqual(-MultiPoly(0), MultiPoly(0))
+        self.assertEqual(-MultiPoly({(1, 0): 1, (0, 1): -2}), MultiPoly({(1, 0): -1, (0, 1): 2}))
+
+    def test_mul(self):
+        # Different symbols for the indeterminates
+        with self.assertRaises(ValueError):
+            poly = MultiPoly(1, symbols=('x', 'y')) * MultiPoly(1, symbols=('x', 'z'))
+
+        # Exponent overflow
+        with self.assertRaises(ValueError):
+            poly = MultiPoly({(2 ** 15 - 1, 0): 1}) * MultiPoly({(1, 0): 1})
+
+        # Number input
+        self.assertEqual(MultiPoly({(1, 1): 2}) * 0, MultiPoly(0))
+        self.assertEqual(MultiPoly({(1, 1): 2}) * 3, MultiPoly({(1, 1): 6}))
+
+        # Reflected Number input
+        self.assertEqual(3 * MultiPoly({(1, 1): 2}), MultiPoly({(1, 1): 6}))
+
+        # Poly input in both operand orders
+        x = MultiPoly({(1, 0): 1})
+        self.assertEqual(x * Poly([1, 1], symbol='y'), MultiPoly({(1, 1): 1, (1, 0): 1}))
+        self.assertEqual(Poly([1, 1], symbol='y') * x, MultiPoly({(1, 1): 1, (1, 0): 1}))
+
+        # MultiPoly input
+        x, y = MultiPoly({(1, 0): 1}), MultiPoly({(0, 1): 1})
+        self.assertEqual((x + y) * (x - y), MultiPoly({(2, 0): 1, (0, 2): -1}))
+        self.assertEqual((x + 1) * (y + 2), MultiPoly({(1, 1): 1, (1, 0): 2, (0, 1): 1, (0, 0): 2}))
+
+        # Equal monomials from several partial products are combined
+        poly = (x + y + 1) * (x + y - 1) * (x - y)
+        self.assertEqual(poly, MultiPoly({(3, 0): 1, (2, 1): 1, (1, 2): -1, (0, 3): -1, (1, 0): -1, (0, 1): 1}))
+        self.assertEqual(list(poly.coef.keys()), sorted(poly.coef.keys(), reverse=True))
+
+        # Agreement with the univariate product
+        p, q = Poly([1, -2, 0, 3]), Poly([4, 0, 5])
+        self.assertEqual((MultiPoly.from_poly(p) * MultiPoly.from_poly(q)).to_poly(), p * q)
+
+    def test_pow(self):
+        # Wrong power type and value
+        self.assertRaises(TypeError, lambda: MultiPoly(1) ** 1.5)
+        self.assertRaises(ValueError, lambda: MultiPoly(1) ** -1)
+
+        x, y = MultiPoly({(1, 0): 1}), MultiPoly({(0, 1): 1})
+        self.assertEqual((x + y) ** 0, MultiPoly(1))
+        self.assertEqual((x + y) ** 2, MultiPoly({(2, 0): 1, (1, 1): 2, (0, 2): 1}))
+
+    def test_eq(self):
+        # Non-MultiPoly comparands are never equal
+        self.assertFalse(MultiPoly(1) == 1)
+        self.assertFalse(MultiPoly(1) == Poly(1))
+        self.assertFalse(Poly(1) == MultiPoly(1))
+
+        self.assertTrue(MultiPoly({(1, 2): 3}) == MultiPoly({(1, 2): 3}))
+        self.assertFalse(MultiPoly({(1, 2): 3}) == MultiPoly({(2, 1): 3}))
+        self.assertFalse(MultiPoly(1, symbols=('x', 'y')) == MultiPoly(1, symbols=('y', 'x')))
+
+    def test_ne(self):
+        # Non-MultiPoly comparands always differ
+        self.assertTrue(MultiPoly(1) != 1)
+        self.assertTrue(MultiPoly(1) != Poly(1))
+        self.assertTrue(Poly(1) != MultiPoly(1))
+
+        self.assertFalse(MultiPoly({(1, 2): 3}) != MultiPoly({(1, 2): 3}))
+        self.assertTrue(MultiPoly({(1, 2): 3}) != MultiPoly({(1, 2): 4}))
+        self.assertTrue(MultiPoly(1, symbols=('x', 'y')) != MultiPoly(1, symbols=('y', 'x')))
+
+
+if __name__ == '__main__':
+    unittest.main()
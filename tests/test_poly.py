@@ -1,3 +1,5 @@
+import copy
+import pickle
 import unittest
 import numpy as np
 from poly import Poly
@@ -86,6 +88,11 @@ class TestPoly(unittest.TestCase):
         self.assertEqual(Poly({0: 1, 1: 0, 2: 1}).coef, {0: 1.0, 2: 1.0})
         self.assertEqual(Poly({0: 1, 1: 1, 2: 1}).coef, {0: 1.0, 1: 1.0, 2: 1.0})
 
+        # Coefficients of another polynomial as an input
+        poly = Poly({0: 1, 3: -2})
+        self.assertEqual(Poly(poly.coef).coef, {0: 1.0, 3: -2.0})
+        self.assertEqual(Poly(poly.coef, symbol='y'), Poly({0: 1, 3: -2}, symbol='y'))
+
     def test_degree(self):
         # Number input
         self.assertEqual(Poly(0).degree, 0)
@@ -321,16 +328,16 @@ class TestPoly(unittest.TestCase):
                          (Poly([1, -4, 2]), Poly([-8, 1])))
 
     def test_eq(self):
-        # Wrong input type
-        with self.assertRaises(TypeError):
-            # Number input
-            Poly(-5) == -5
+        # Non-Poly comparands are never equal
+        self.assertFalse(Poly(-5) == -5)
+        self.assertFalse(Poly([1, 2, 3]) == [1, 2, 3])
+        self.assertFalse(Poly({3: 3, 4: 4}) == {3: 3, 4: 4})
+        self.assertFalse(Poly(0) == None)
 
-            # List input
-            Poly([1, 2, 3]) == [1, 2, 3]
-
-            # Dict input
-            Poly({3: 3, 4: 4}) == {3: 3, 4: 4}
+        # Membership among other types
+        poly = Poly([1, 2])
+        self.assertIn(poly, [None, 'a', poly])
+        self.assertNotIn(Poly(3), {None, 3, 'a'})
 
         # Different symbols for the indeterminate
         self.assertFalse(Poly({1: 2, 3: 4, 5: 6}, symbol='x') == Poly({1: 2, 3: 4, 5: 6}, symbol='y'))
@@ -352,16 +359,11 @@ class TestPoly(unittest.TestCase):
         self.assertTrue(poly == Poly({1: 2, 3: 4, 5: 6}))
 
     def test_ne(self):
-        # Wrong input type
-        with self.assertRaises(TypeError):
-            # Number input
-            Poly(-5) != -5
-
-            # List input
-            Poly([1, 2, 3]) != [1, 2, 3]
-
-            # Dict input
-            Poly({3: 3, 4: 4}) != {3: 3, 4: 4}
+        # Non-Poly comparands are always different
+        self.assertTrue(Poly(-5) != -5)
+        self.assertTrue(Poly([1, 2, 3]) != [1, 2, 3])
+        self.assertTrue(Poly({3: 3, 4: 4}) != {3: 3, 4: 4})
+        self.assertTrue(Poly(0) != None)
 
         # Different symbols for the indeterminate
         self.assertTrue(Poly({1: 2, 3: 4, 5: 6}, symbol='x') != Poly({1: 2, 3: 4, 5: 6}, symbol='y'))
@@ -382,6 +384,42 @@ class TestPoly(unittest.TestCase):
         poly = Poly({1: 2, 3: 4, 5: 6})
         self.assertFalse(poly != Poly({1: 2, 3: 4, 5: 6}))
 
+    def test_hash(self):
+        # Equal polynomials have equal hashes
+        self.assertEqual(hash(Poly([1, 0, 2])), hash(Poly({2: 2, 0: 1})))
+        self.assertEqual(hash(Poly(0)), hash(Poly([0, 0, 0])))
+
+        # Polynomials as dict keys and set members
+        self.assertEqual(len({Poly([1, 2]), Poly((1, 2)), Poly(np.array([1, 2])), Poly([1, 2], symbol='y')}), 2)
+        self.assertEqual({Poly([1, 2]): 'a'}[Poly({0: 1, 1: 2})], 'a')
+
+    def test_immutable(self):
+        poly = Poly([1, 2, 3])
+
+        with self.assertRaises(AttributeError):
+            poly._coef = {0: 1.0}
+        with self.assertRaises(AttributeError):
+            poly.new_attribute = 1
+        with self.assertRaises(AttributeError):
+            del poly._symbol
+        with self.assertRaises(TypeError):
+            poly.coef[0] = 5.0
+
+        self.assertEqual(poly, Poly([1, 2, 3]))
+
+    def test_reduce(self):
+        poly = Poly({0: -1, 3: 2.5}, symbol='y')
+
+        # Pickle round trip
+        poly_pickled = pickle.loads(pickle.dumps(poly))
+        self.assertEqual(poly_pickled, poly)
+        self.assertEqual(hash(poly_pickled), hash(poly))
+
+        # Deep copy round trip
+        poly_copy = copy.deepcopy(poly)
+        self.assertEqual(poly_copy, poly)
+        self.assertIsNot(poly_copy, poly)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,114 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+from poly import Poly, evaluate_chunks, evaluate_to
+
+
+class TestStream(unittest.TestCase):
+
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.x = np.linspace(-2, 2, 1001)
+        self.poly = Poly({0: 1, 1: -2, 5: 0.5, 9: 3})
+        self.values = 1 - 2 * self.x + 0.5 * self.x ** 5 + 3 * self.x ** 9
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_evaluate_chunks(self):
+        # Wrong input types
+        self.assertRaises(TypeError, evaluate_chunks, [1, 2], self.x)
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, [1, 2])
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, np.array([1 + 2j]))
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, np.array([True, False]))
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, np.array([1.0, None]))
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, self.x, chunk_size=1.5)
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, self.x, workers='a')
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, self.x, chunk_size=True)
+        self.assertRaises(TypeError, evaluate_chunks, self.poly, self.x, workers=True)
+
+        # Wrong input values
+        self.assertRaises(ValueError, evaluate_chunks, [], self.x)
+        self.assertRaises(ValueError, evaluate_chunks, self.poly, np.zeros((2, 2)))
+        self.assertRaises(ValueError, evaluate_chunks, self.poly, self.x, chunk_size=0)
+        self.assertRaises(ValueError, evaluate_chunks, self.poly, self.x, workers=0)
+
+        # Single polynomial
+        chunks = list(evaluate_chunks(self.poly, self.x, chunk_size=100))
+        self.assertEqual(len(chunks), 11)
+        self.assertEqual(chunks[-1].shape, (1,))
+        self.assertTrue(np.allclose(np.concatenate(chunks), self.values))
+
+        # Sequence of polynomials evaluated by threads
+        chunks = list(evaluate_chunks([self.poly, Poly(0), Poly(2)], self.x, chunk_size=64, workers=3))
+        values = np.concatenate(chunks, axis=1)
+        self.assertEqual(values.shape, (3, 1001))
+        self.assertTrue(np.allclose(values[0], self.values))
+        self.assertTrue(np.all(values[1] == 0.0))
+        self.assertTrue(np.all(values[2] == 2.0))
+
+    def test_evaluate_chunks_file(self):
+        raw_path = os.path.join(self.dir.name, 'x.bin')
+        npy_path = os.path.join(self.dir.name, 'x.npy')
+        self.x.tofile(raw_path)
+        np.save(npy_path, self.x)
+
+        for path in (raw_path, npy_path):
+            values = np.concatenate(list(evaluate_chunks(self.poly, path, chunk_size=128, workers=2)))
+            self.assertTrue(np.allclose(values, self.values))
+
+        # Empty files
+        empty_raw_path = os.path.join(self.dir.name, 'empty.bin')
+        empty_npy_path = os.path.join(self.dir.name, 'empty.npy')
+        open(empty_raw_path, 'wb').close()
+        np.save(empty_npy_path, np.empty(0))
+
+        for path in (empty_raw_path, empty_npy_path):
+            self.assertEqual(list(evaluate_chunks(self.poly, path)), [])
+
+    def test_evaluate_to(self):
+        # Wrong source dtype, also when read from a file
+        complex_path = os.path.join(self.dir.name, 'complex.npy')
+        np.save(complex_path, np.array([1 + 2j]))
+        self.assertRaises(TypeError, evaluate_to, Poly([0, 1]), np.array([1 + 2j]), np.empty(1))
+        self.assertRaises(TypeError, evaluate_to, Poly([0, 1]), complex_path, np.empty(1))
+
+        # Wrong output type and shape
+        self.assertRaises(TypeError, evaluate_to, self.poly, self.x, [0.0] * 1001)
+        self.assertRaises(ValueError, evaluate_to, self.poly, self.x, np.empty(1000))
+        self.assertRaises(ValueError, evaluate_to, [self.poly], self.x, np.empty(1001))
+        self.assertRaises(ValueError, evaluate_to, self.poly, self.x, np.empty(1001, dtype=np.float32))
+
+        # Array output
+        out = np.empty((2, 1001))
+        self.assertIs(evaluate_to([self.poly, -self.poly], self.x, out, chunk_size=100, workers=4), out)
+        self.assertTrue(np.allclose(out[0], self.values))
+        self.assertTrue(np.allclose(out[1], -self.values))
+
+        # Raw file output
+        raw_path = os.path.join(self.dir.name, 'out.bin')
+        evaluate_to(self.poly, self.x, raw_path, chunk_size=100)
+        self.assertTrue(np.allclose(np.fromfile(raw_path), self.values))
+
+        # .npy file output
+        npy_path = os.path.join(self.dir.name, 'out.npy')
+        evaluate_to([self.poly, Poly(3)], self.x, npy_path, chunk_size=100, workers=2)
+        values = np.load(npy_path)
+        self.assertEqual(values.shape, (2, 1001))
+        self.assertTrue(np.allclose(values[0], self.values))
+        self.assertTrue(np.all(values[1] == 3.0))
+
+        # Integer source converted chunk by chunk
+        out = evaluate_to(Poly([1, 1]), np.arange(10), np.empty(10), chunk_size=3)
+        self.assertTrue(np.all(out == np.arange(1, 11)))
+
+        # Empty source
+        empty_raw_path = os.path.join(self.dir.name, 'empty.bin')
+        self.assertEqual(evaluate_to(self.poly, np.empty(0), empty_raw_path).shape, (0,))
+        self.assertEqual(os.path.getsize(empty_raw_path), 0)
+        self.assertEqual(evaluate_to([self.poly], empty_raw_path, np.empty((1, 0))).shape, (1, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()